@@ -0,0 +1,77 @@
+# Copyright (C) 2025  J. Alex Long <jalexlong@proton.me>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Cell values and the flood fill shared by the different board layouts."""
+
+from .board import Stone
+
+from functools import lru_cache
+from typing import Callable, Hashable, Iterable, Optional, TypeVar
+
+# Integer cell values used by the array and flat list board layouts.
+EMPTY = 0
+BLACK = Stone.BLACK.value + 1
+WHITE = Stone.WHITE.value + 1
+BORDER = 3
+
+Cell = TypeVar('Cell', bound=Hashable)
+
+
+def cell_value(stone: Optional[Stone]) -> int:
+    """Returns the cell value of a point of Board.state."""
+    return EMPTY if stone is None else stone.value + 1
+
+
+@lru_cache(maxsize=18)
+def neighbor_table(size: int) -> list[list[list[tuple[int, int]]]]:
+    """Returns the on-board (row, col) neighbors of every cell of a board."""
+    table = []
+    for r in range(size):
+        row = []
+        for c in range(size):
+            cells = [(r-1, c), (r+1, c), (r, c-1), (r, c+1)]
+            row.append([(nr, nc) for nr, nc in cells
+                        if 0 <= nr < size and 0 <= nc < size])
+        table.append(row)
+    return table
+
+
+def flood_fill(start: Cell,
+               neighbors: Callable[[Cell], Iterable[Cell]],
+               value: Callable[[Cell], object],
+               ) -> tuple[list[Cell], set[Cell]]:
+    """
+    Returns the region of cells connected to start that have the same value,
+    e.g. a group of stones or an area of empty points, and the cells
+    bordering that region.
+
+    Args:
+        start: The cell to start from.
+        neighbors: Returns the adjacent cells of a cell.
+        value: Returns the contents of a cell.
+    """
+    color = value(start)
+    region = [start]
+    seen = {start}
+    border = set()
+    for cell in region:
+        for neighbor in neighbors(cell):
+            if neighbor not in seen:
+                if value(neighbor) == color:
+                    seen.add(neighbor)
+                    region.append(neighbor)
+                else:
+                    border.add(neighbor)
+    return region, border
@@ -0,0 +1,256 @@
+# Copyright (C) 2025  J. Alex Long <jalexlong@proton.me>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Turns a Game into stacked NumPy input planes for neural networks.
+
+Requires numpy, which can be installed with `pip install libgoban[numpy]`.
+"""
+
+from ._cells import BLACK, BORDER, EMPTY, WHITE, cell_value, flood_fill, neighbor_table
+from .board import Stone
+from .game import Game, Move
+
+from typing import Sequence
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
+
+
+# +---------------------------+
+# |  FEATURE EXTRACTOR CLASS  |
+# +---------------------------+
+
+class FeatureExtractor:
+    """
+    Keeps the input planes of a Game up to date as moves are made.
+
+    Planes are laid out as (C, size, size) and indexed [plane, row-1, col-1],
+    the same orientation as Board.state. From the point of view of the side
+    to move, the C = 2*history + liberty_planes + 2 planes are:
+
+        - own stones and opponent stones for each of the last `history`
+          positions, most recent first (2*history planes),
+        - the liberties of the group on each point, bucketed as
+          1, 2, ..., liberty_planes-1 and >= liberty_planes,
+        - all ones if black is to move, all zeros otherwise,
+        - a mask of the legal moves for the side to move, i.e. empty points
+          that are neither suicide nor a simple ko recapture.
+
+    Captures are resolved by the extractor itself, so it does not matter
+    whether or when the game takes captured stones off its board. Moves that
+    are taken back are not followed: call reset() after Game.undo_last_move.
+    """
+    def __init__(self,
+                 game: Game,
+                 history: int = 8,
+                 liberty_planes: int = 4,
+                 attach: bool = True,
+                 ):
+        """
+        Initializes a new FeatureExtractor from the current state of a Game.
+
+        Args:
+            game: The game to extract features from.
+            history: Number of past positions to keep stone planes for.
+            liberty_planes: Number of liberty bucket planes.
+            attach: If True, register with game.move_listeners so the planes
+                    are updated every time game.make_move is called.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If history or liberty_planes is less than 1.
+        """
+        if np is None:
+            raise ImportError("FeatureExtractor requires numpy, "
+                              "install it with `pip install libgoban[numpy]`")
+        if history < 1:
+            raise ValueError(f"Invalid history length: {history}")
+        if liberty_planes < 1:
+            raise ValueError(f"Invalid number of liberty planes: {liberty_planes}")
+
+        self.game = game
+        self.size = game.board.size
+        self.history = history
+        self.liberty_planes = liberty_planes
+        self._neighbors = neighbor_table(self.size)
+        self.reset()
+        if attach:
+            game.move_listeners.append(self.on_move)
+
+    @property
+    def num_planes(self) -> int:
+        """Returns the number of planes C written by fill()."""
+        return 2*self.history + self.liberty_planes + 2
+
+    def reset(self):
+        """
+        Rebuilds all state from the game's board.
+
+        Needed whenever the board changes other than through make_move,
+        e.g. after Game.undo_last_move. Positions from before the reset are
+        unknown and left empty in the history planes.
+        """
+        size = self.size
+        self._stones = np.zeros((size, size), dtype=np.int8)
+        for r, row in enumerate(self.game.board.state):
+            for c, stone in enumerate(row):
+                self._stones[r, c] = cell_value(stone)
+        self._liberties = np.zeros((size, size), dtype=np.int16)
+        self._update_liberties((r, c) for r in range(size) for c in range(size))
+        # Ring buffer of past positions, self._head points at the current one.
+        self._positions = np.zeros((self.history, size, size), dtype=np.int8)
+        self._head = 0
+        self._positions[0] = self._stones
+        # Point that may not be played next because of simple ko, if any.
+        self._ko = None
+
+    def detach(self):
+        """Stops following the game's moves."""
+        if self.on_move in self.game.move_listeners:
+            self.game.move_listeners.remove(self.on_move)
+
+    def on_move(self, game: Game, move: Move):
+        """Updates the planes after move was made in game."""
+        self._ko = None
+        if move.point is not None:
+            col, row = move.point
+            cell = (row-1, col-1)
+            self._stones[cell] = cell_value(move.stone)
+            captured = []
+            opp = cell_value(move.stone.OTHER)
+            for neighbor in self._neighbors[cell[0]][cell[1]]:
+                if self._stones[neighbor] == opp and not self._group(neighbor)[1]:
+                    captured.extend(self._remove_group(neighbor))
+            touched = [cell] + captured
+            # Only groups next to a changed point can have changed liberties.
+            affected = []
+            for r, c in touched:
+                if self._stones[r, c] != EMPTY:
+                    affected.append((r, c))
+                affected.extend(self._neighbors[r][c])
+            self._update_liberties(affected)
+            if len(captured) == 1 and self._liberties[cell] == 1:
+                stones, _ = self._group(cell)
+                if len(stones) == 1:
+                    self._ko = captured[0]
+
+        self._head = (self._head + 1) % self.history
+        self._positions[self._head] = self._stones
+
+    def fill(self, out: 'np.ndarray') -> 'np.ndarray':
+        """
+        Writes the current planes into a preallocated array.
+
+        Args:
+            out: Array of shape (C, size, size), where C is self.num_planes.
+
+        Returns:
+            out, for convenience.
+
+        Raises:
+            ValueError: If out has the wrong shape.
+        """
+        expected = (self.num_planes, self.size, self.size)
+        if out.shape != expected:
+            raise ValueError(f"Expected an array of shape {expected}, got {out.shape}")
+
+        own = cell_value(self.game.turn)
+        opp = cell_value(self.game.turn.OTHER)
+        for t in range(self.history):
+            position = self._positions[(self._head - t) % self.history]
+            np.equal(position, own, out=out[2*t])
+            np.equal(position, opp, out=out[2*t + 1])
+
+        base = 2*self.history
+        for i in range(1, self.liberty_planes):
+            np.equal(self._liberties, i, out=out[base + i - 1])
+        np.greater_equal(self._liberties, self.liberty_planes,
+                         out=out[base + self.liberty_planes - 1])
+
+        base += self.liberty_planes
+        out[base] = 1 if self.game.turn == Stone.BLACK else 0
+        self._legal_moves(own, out[base + 1])
+        return out
+
+    def planes(self, dtype=None) -> 'np.ndarray':
+        """Returns the current planes in a newly allocated array."""
+        out = np.empty((self.num_planes, self.size, self.size),
+                       dtype=np.float32 if dtype is None else dtype)
+        return self.fill(out)
+
+    def _legal_moves(self, own: int, out: 'np.ndarray'):
+        """Writes the legal moves of the side with cell value own into out."""
+        opp = BLACK + WHITE - own
+        stones = np.pad(self._stones, 1, constant_values=BORDER)
+        liberties = np.pad(self._liberties, 1)
+        has_liberty = np.zeros((self.size, self.size), dtype=bool)
+        # A stone placed on an empty point keeps a liberty if it touches an
+        # empty point, an own group with another liberty, or captures an
+        # opponent group in atari.
+        for window in ((slice(None, -2), slice(1, -1)), (slice(2, None), slice(1, -1)),
+                       (slice(1, -1), slice(None, -2)), (slice(1, -1), slice(2, None))):
+            neighbor = stones[window]
+            neighbor_liberties = liberties[window]
+            has_liberty |= neighbor == EMPTY
+            has_liberty |= (neighbor == own) & (neighbor_liberties > 1)
+            has_liberty |= (neighbor == opp) & (neighbor_liberties == 1)
+        np.logical_and(self._stones == EMPTY, has_liberty, out=out)
+        if self._ko is not None:
+            out[self._ko] = 0
+
+    def _group(self, cell: tuple[int, int]) -> tuple[list[tuple[int, int]], set[tuple[int, int]]]:
+        """Returns the stones and liberties of the group on cell."""
+        stones, border = flood_fill(cell, lambda c: self._neighbors[c[0]][c[1]],
+                                    self._stones.__getitem__)
+        return stones, {c for c in border if self._stones[c] == EMPTY}
+
+    def _remove_group(self, cell: tuple[int, int]) -> list[tuple[int, int]]:
+        """Empties the group on cell and returns its stones."""
+        stones, _ = self._group(cell)
+        for stone in stones:
+            self._stones[stone] = EMPTY
+            self._liberties[stone] = 0
+        return stones
+
+    def _update_liberties(self, cells):
+        """Recounts the liberties of every group with a stone in cells."""
+        done = set()
+        for cell in cells:
+            if cell in done or self._stones[cell] == EMPTY:
+                continue
+            stones, liberties = self._group(cell)
+            for stone in stones:
+                self._liberties[stone] = len(liberties)
+            done.update(stones)
+
+
+def fill_batch(extractors: Sequence[FeatureExtractor], out: 'np.ndarray') -> 'np.ndarray':
+    """
+    Writes the planes of several games into a preallocated batch array.
+
+    Args:
+        extractors: One FeatureExtractor per game in the batch.
+        out: Array of shape (B, C, size, size) with B >= len(extractors).
+
+    Returns:
+        out, for convenience.
+    """
+    if len(extractors) > len(out):
+        raise ValueError(f"Batch of size {len(out)} cannot hold {len(extractors)} games")
+    for i, extractor in enumerate(extractors):
+        extractor.fill(out[i])
+    return out
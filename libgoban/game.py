@@ -13,10 +13,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from ._cells import flood_fill, neighbor_table
 from .board import Stone, Point, Board
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Iterable, Optional
 
 
 # +-----------------+
@@ -95,6 +96,9 @@ class Game:
         self.komi = komi
         self.captures = captures
         self.playing = False
+        # Callables run as listener(game, move) after every make_move, so
+        # that derived state (e.g. feature planes) can be kept up to date.
+        self.move_listeners: list[Callable[['Game', Move], None]] = []
 
     def make_move(self, move: Move):
         """Makes move in self.board, self.history and changes self.turn"""
@@ -102,6 +106,8 @@ class Game:
         self.board[move.point] = move.stone
         self.history.append(move)
         self.turn = self.turn.OTHER
+        for listener in self.move_listeners:
+            listener(self, move)
         #else:
         #    raise ValueError(f"The move {move} ")
 
@@ -112,6 +118,39 @@ class Game:
         self.remove_stone(last_move.point)
         self.turn = self.turn.opposite_color()
 
+    def score(self, dead_stones: Iterable[Point] = ()) -> dict:
+        """
+        Returns the area score of each player, komi included.
+
+        Args:
+            dead_stones: Points whose stones are taken off the board before
+                         counting, e.g. from ownership.estimate_ownership().
+        """
+        size = self.board.size
+        state = [row[:] for row in self.board.state]
+        for col, row in dead_stones:
+            state[row-1][col-1] = None
+
+        table = neighbor_table(size)
+        score = {Stone.BLACK: 0.0, Stone.WHITE: self.komi}
+        seen = set()
+        for r in range(size):
+            for c in range(size):
+                if state[r][c] is not None:
+                    score[state[r][c]] += 1
+                    continue
+                if (r, c) in seen:
+                    continue
+                # flood fill the empty region and count it as territory
+                # if it only touches stones of one color
+                region, border = flood_fill((r, c), lambda cell: table[cell[0]][cell[1]],
+                                            lambda cell: state[cell[0]][cell[1]])
+                seen.update(region)
+                borders = {state[br][bc] for br, bc in border}
+                if len(borders) == 1:
+                    score[borders.pop()] += len(region)
+        return score
+
     def end(self): 
         self.playing = False
 
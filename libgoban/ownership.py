@@ -0,0 +1,359 @@
+# Copyright (C) 2025  J. Alex Long <jalexlong@proton.me>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Estimates point ownership and dead stones with random playouts.
+
+Requires numpy, which can be installed with `pip install libgoban[numpy]`.
+"""
+
+from ._cells import BLACK, BORDER, EMPTY, WHITE, cell_value, flood_fill, neighbor_table
+from .board import Stone, Point
+from .game import Game
+
+import random
+from multiprocessing import Pool, TimeoutError
+from dataclasses import dataclass
+from typing import Optional, Protocol, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
+
+
+# +-----------------+
+# |    PLAYOUTS     |
+# +-----------------+
+
+def _playout(board: list[int], width: int, to_move: int, rng: random.Random) -> list[int]:
+    """
+    Plays random moves on board until both sides pass and returns the owner
+    of every cell: 1 for black, -1 for white and 0 for neither.
+
+    Moves are chosen uniformly among the legal moves that do not fill one of
+    the mover's own eyes, and simple ko is respected.
+    """
+    offsets = (1, -1, width, -width)
+    diagonals = (width + 1, width - 1, 1 - width, -1 - width)
+    empties = [p for p, value in enumerate(board) if value == EMPTY]
+    where = [0] * len(board)
+    for i, p in enumerate(empties):
+        where[p] = i
+
+    def swap(i, j):
+        empties[i], empties[j] = empties[j], empties[i]
+        where[empties[i]] = i
+        where[empties[j]] = j
+
+    def neighbors(p):
+        return (p + 1, p - 1, p + width, p - width)
+
+    def group(p):
+        stones, border = flood_fill(p, neighbors, board.__getitem__)
+        return stones, {n for n in border if board[n] == EMPTY}
+
+    def is_eye(p, color):
+        for o in offsets:
+            if board[p + o] != color and board[p + o] != BORDER:
+                return False
+        other = 3 - color
+        bad = 0
+        edge = False
+        for d in diagonals:
+            if board[p + d] == other:
+                bad += 1
+            elif board[p + d] == BORDER:
+                edge = True
+        return bad < (1 if edge else 2)
+
+    def is_playable(p, color, ko):
+        if p == ko or is_eye(p, color):
+            return False
+        for o in offsets:
+            if board[p + o] == EMPTY:
+                return True
+        # Groups can touch p from several sides, only count each one once.
+        checked = set()
+        for o in offsets:
+            n = p + o
+            value = board[n]
+            if value == BORDER or n in checked:
+                continue
+            stones, libs = group(n)
+            if value == color and len(libs) > 1:
+                return True
+            if value != color and len(libs) == 1:
+                return True
+            checked.update(stones)
+        return False
+
+    def play(p, color):
+        board[p] = color
+        swap(where[p], len(empties) - 1)
+        empties.pop()
+        captured = []
+        checked = set()
+        for o in offsets:
+            n = p + o
+            if board[n] == 3 - color and n not in checked:
+                stones, libs = group(n)
+                checked.update(stones)
+                if not libs:
+                    for s in stones:
+                        board[s] = EMPTY
+                        where[s] = len(empties)
+                        empties.append(s)
+                    captured.extend(stones)
+        if len(captured) == 1:
+            stones, libs = group(p)
+            if len(stones) == 1 and len(libs) == 1:
+                return captured[0]
+        return None
+
+    color = to_move
+    ko = None
+    passes = 0
+    for _ in range(3 * width * width):
+        move = None
+        n = len(empties)
+        while n:
+            i = rng.randrange(n)
+            if is_playable(empties[i], color, ko):
+                move = empties[i]
+                break
+            n -= 1
+            swap(i, n)
+        if move is None:
+            passes += 1
+            if passes == 2:
+                break
+            ko = None
+        else:
+            passes = 0
+            ko = play(move, color)
+        color = 3 - color
+
+    owners = []
+    for p, value in enumerate(board):
+        if value == BLACK:
+            owners.append(1)
+        elif value == WHITE:
+            owners.append(-1)
+        elif value == EMPTY:
+            around = {board[p + o] for o in offsets} - {BORDER, EMPTY}
+            if around == {BLACK}:
+                owners.append(1)
+            elif around == {WHITE}:
+                owners.append(-1)
+            else:
+                owners.append(0)
+        else:
+            owners.append(0)
+    return owners
+
+
+def _run_playouts(size: int, cells: tuple[int, ...], to_move: int,
+                  playouts: int, seed: int) -> 'np.ndarray':
+    """Runs playouts from cells and returns the summed ownership per point."""
+    width = size + 2
+    rng = random.Random(seed)
+    totals = [0] * len(cells)
+    for _ in range(playouts):
+        owners = _playout(list(cells), width, to_move, rng)
+        for p, owner in enumerate(owners):
+            totals[p] += owner
+    totals = np.array(totals, dtype=np.int64).reshape(width, width)
+    return totals[1:-1, 1:-1]
+
+
+def _run_task(task: tuple[int, tuple]) -> tuple[int, 'np.ndarray']:
+    """Runs one chunk of playouts in a worker and tags it with its game index."""
+    i, args = task
+    return i, _run_playouts(*args)
+
+
+def _padded_cells(game: Game) -> tuple[int, ...]:
+    """Returns the game's board as a flat padded tuple of cell values."""
+    size = game.board.size
+    width = size + 2
+    cells = [BORDER] * (width * width)
+    for r, row in enumerate(game.board.state):
+        for c, stone in enumerate(row):
+            cells[(r+1) * width + c + 1] = cell_value(stone)
+    return tuple(cells)
+
+
+def _dead_stones(state: list[list[Optional[Stone]]], ownership: 'np.ndarray',
+                 threshold: float) -> set[Point]:
+    """
+    Returns the stones of every group whose average ownership favours the
+    other color by more than threshold.
+
+    Whole groups are judged at once so that scoring never removes only
+    part of a group.
+    """
+    size = len(state)
+    table = neighbor_table(size)
+    dead_stones = set()
+    seen = set()
+    for r in range(size):
+        for c in range(size):
+            stone = state[r][c]
+            if stone is None or (r, c) in seen:
+                continue
+            group, _ = flood_fill((r, c), lambda cell: table[cell[0]][cell[1]],
+                                  lambda cell: state[cell[0]][cell[1]])
+            seen.update(group)
+            sign = 1 if stone == Stone.BLACK else -1
+            average = sum(ownership[gr, gc] for gr, gc in group) / len(group)
+            if sign * average < -threshold:
+                dead_stones.update(Point(gc+1, gr+1) for gr, gc in group)
+    return dead_stones
+
+
+# +-----------------------------+
+# |   CUSTOM OWNERSHIP ERRORS   |
+# +-----------------------------+
+
+class OwnershipCancelledError(RuntimeError):
+    """Raise when an ownership estimation is cancelled before it finishes."""
+
+
+# +-----------------------------+
+# |   CANCEL EVENT PROTOCOL     |
+# +-----------------------------+
+
+class CancelEvent(Protocol):
+    """Anything that can tell an estimation to stop, e.g. a threading.Event."""
+    def is_set(self) -> bool: ...
+
+
+# +-----------------------------+
+# |   OWNERSHIP ESTIMATE CLASS  |
+# +-----------------------------+
+
+@dataclass
+class OwnershipEstimate:
+    # Average owner of every point, indexed [row-1, col-1] like Board.state,
+    # from 1 (always black) to -1 (always white).
+    ownership: 'np.ndarray'
+    dead_stones: set[Point]
+    playouts: int
+
+
+def estimate_ownership(game: Game,
+                       playouts: int = 100,
+                       workers: Optional[int] = 1,
+                       chunk_size: int = 16,
+                       dead_threshold: float = 0.5,
+                       seed: Optional[int] = None,
+                       cancel: Optional['CancelEvent'] = None,
+                       ) -> OwnershipEstimate:
+    """
+    Estimates the ownership of every point of a game with random playouts.
+
+    See estimate_ownership_batch() for a description of the arguments.
+    """
+    return estimate_ownership_batch([game], playouts, workers, chunk_size,
+                                    dead_threshold, seed, cancel)[0]
+
+
+def estimate_ownership_batch(games: Sequence[Game],
+                             playouts: int = 100,
+                             workers: Optional[int] = 1,
+                             chunk_size: int = 16,
+                             dead_threshold: float = 0.5,
+                             seed: Optional[int] = None,
+                             cancel: Optional['CancelEvent'] = None,
+                             ) -> list[OwnershipEstimate]:
+    """
+    Estimates the ownership of every point of several games with random playouts.
+
+    Playouts are split into chunks of chunk_size, which are run in a process
+    pool when workers is not 1. The dead stones of each estimate can be passed
+    on to Game.score().
+
+    Args:
+        games: The games to estimate, from their current position.
+        playouts: Number of playouts per game.
+        workers: Number of worker processes, 1 runs everything in this
+                 process and None uses one per CPU.
+        chunk_size: Number of playouts run by a single task.
+        dead_threshold: Groups whose ownership, averaged over their stones,
+                        favours the other color by more than this are
+                        considered dead.
+        seed: Seed for reproducible estimates.
+        cancel: A CancelEvent, such as a threading.Event. When running in
+                this process it is checked between chunks. With a process
+                pool it is polled while waiting for results and, once set,
+                the worker processes are terminated, so running and queued
+                chunks are thrown away without being finished.
+
+    Returns:
+        One OwnershipEstimate per game, in order.
+
+    Raises:
+        ImportError: If numpy is not installed.
+        ValueError: If playouts, workers or chunk_size is less than 1.
+        OwnershipCancelledError: If cancel was set before all chunks finished.
+    """
+    if np is None:
+        raise ImportError("estimate_ownership requires numpy, "
+                          "install it with `pip install libgoban[numpy]`")
+    if playouts < 1:
+        raise ValueError(f"Invalid number of playouts: {playouts}")
+    if workers is not None and workers < 1:
+        raise ValueError(f"Invalid number of workers: {workers}")
+    if chunk_size < 1:
+        raise ValueError(f"Invalid chunk size: {chunk_size}")
+
+    rng = random.Random(seed)
+    tasks = []
+    for i, game in enumerate(games):
+        cells = _padded_cells(game)
+        to_move = cell_value(game.turn)
+        for start in range(0, playouts, chunk_size):
+            n = min(chunk_size, playouts - start)
+            tasks.append((i, (game.board.size, cells, to_move, n, rng.getrandbits(64))))
+
+    totals = [np.zeros((game.board.size, game.board.size), dtype=np.int64) for game in games]
+    if workers == 1:
+        for i, args in tasks:
+            if cancel is not None and cancel.is_set():
+                raise OwnershipCancelledError("Ownership estimation was cancelled")
+            totals[i] += _run_playouts(*args)
+    else:
+        # Leaving the with block terminates and joins the workers, which
+        # stops any chunks still running when cancelled.
+        with Pool(processes=workers) as pool:
+            results = pool.imap_unordered(_run_task, tasks)
+            timeout = None if cancel is None else 0.1
+            pending = len(tasks)
+            while pending:
+                if cancel is not None and cancel.is_set():
+                    raise OwnershipCancelledError("Ownership estimation was cancelled")
+                try:
+                    i, total = results.next(timeout=timeout)
+                except TimeoutError:
+                    continue
+                totals[i] += total
+                pending -= 1
+
+    estimates = []
+    for game, total in zip(games, totals):
+        ownership = total / playouts
+        dead_stones = _dead_stones(game.board.state, ownership, dead_threshold)
+        estimates.append(OwnershipEstimate(ownership, dead_stones, playouts))
+    return estimates
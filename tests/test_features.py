@@ -0,0 +1,106 @@
+# Copyright (C) 2025  J. Alex Long <jalexlong@proton.me>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+from libgoban import Stone, Point, Board, Game, Move, Player
+
+np = pytest.importorskip("numpy")
+from libgoban.features import FeatureExtractor, fill_batch
+
+
+def new_game(size=9):
+    return Game(Player("black", Stone.BLACK), Player("white", Stone.WHITE),
+                Board(size), history=[])
+
+
+def test_features_incremental_matches_reset():
+    game = new_game()
+    extractor = FeatureExtractor(game, history=2)
+    game.make_move(Move(Point(3, 3), Stone.BLACK))
+    game.make_move(Move(Point(3, 4), Stone.WHITE))
+    game.make_move(Move(Point(4, 3), Stone.BLACK))
+
+    planes = extractor.planes()
+    assert planes.shape == (extractor.num_planes, 9, 9)
+    # white to move: own stones are white, opponent stones are black
+    assert planes[0][3, 2] == 1 and planes[0].sum() == 1
+    assert planes[1][2, 2] == 1 and planes[1][2, 3] == 1 and planes[1].sum() == 2
+    # previous position did not have the last black stone yet
+    assert planes[3][2, 3] == 0 and planes[3].sum() == 1
+    # liberty buckets: the black pair has 5 liberties, the white stone 3
+    assert planes[4 + 2][3, 2] == 1
+    assert planes[4 + 3][2, 2] == 1 and planes[4 + 3][2, 3] == 1
+    # side to move and legal mask
+    assert planes[8].sum() == 0
+    assert planes[9].sum() == 81 - 3
+
+    rebuilt = FeatureExtractor(game, history=2, attach=False).planes()
+    np.testing.assert_array_equal(planes[[0, 1] + list(range(4, 10))],
+                                  rebuilt[[0, 1] + list(range(4, 10))])
+
+
+def test_features_resolve_captures():
+    game = new_game()
+    extractor = FeatureExtractor(game, history=1)
+    game.make_move(Move(Point(1, 1), Stone.WHITE))
+    game.make_move(Move(Point(2, 1), Stone.BLACK))
+    game.make_move(Move(Point(1, 2), Stone.BLACK))
+
+    planes = extractor.planes()
+    assert planes[1][0, 0] == 0
+    assert planes[2 + 2][0, 1] == 1  # three liberties after the capture
+    assert planes[2 + 4 + 1][0, 0] == 0  # empty again, but suicide for white
+
+    # the game taking the stone off afterwards changes nothing
+    game.board[Point(1, 1)] = None
+    game.make_move(Move(Point(9, 9), Stone.WHITE))
+    planes = extractor.planes()
+    assert planes[0][0, 0] == 0 and planes[1][0, 0] == 0
+    assert planes[2 + 4 + 1][0, 0] == 1
+
+
+def test_features_fill_batch():
+    games = [new_game(), new_game()]
+    extractors = [FeatureExtractor(game) for game in games]
+    games[1].make_move(Move(Point(5, 5), Stone.BLACK))
+
+    out = np.zeros((4, extractors[0].num_planes, 9, 9), dtype=np.float32)
+    fill_batch(extractors, out)
+    assert out[0, :16].sum() == 0
+    assert out[1, 1, 4, 4] == 1
+    assert out[2:].sum() == 0
+
+    with pytest.raises(ValueError):
+        extractors[0].fill(np.zeros((3, 9, 9)))
+
+
+def test_features_legal_mask_suicide_and_ko():
+    game = new_game()
+    for point in [Point(1, 2), Point(2, 1), Point(2, 3)]:
+        game.board[point] = Stone.BLACK
+    for point in [Point(2, 2), Point(4, 2), Point(3, 1), Point(3, 3)]:
+        game.board[point] = Stone.WHITE
+    extractor = FeatureExtractor(game, history=1)
+    # black captures on B2 by playing C2
+    game.make_move(Move(Point(3, 2), Stone.BLACK))
+
+    legal = extractor.planes()[2 + 4 + 1]
+    assert legal[1, 1] == 0  # immediate recapture is ko
+    assert legal[0, 0] == 0  # suicide for white
+    assert legal[4, 4] == 1
+
+    game.make_move(Move(Point(7, 7), Stone.WHITE))
+    legal = extractor.planes()[2 + 4 + 1]
+    assert legal[1, 1] == 1  # black may fill the ko
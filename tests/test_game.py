@@ -0,0 +1,56 @@
+# Copyright (C) 2025  J. Alex Long <jalexlong@proton.me>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+from libgoban import Stone, Point, Board, Game, Player
+
+
+def new_game(board):
+    return Game(Player("black", Stone.BLACK), Player("white", Stone.WHITE),
+                board, history=[])
+
+
+def walled_game():
+    # black walls off columns A-B, white walls off columns E-G and
+    # column D is left as dame. The white stone on A1 is dead.
+    board = Board(7)
+    for row in range(1, 8):
+        board[Point(3, row)] = Stone.BLACK
+        board[Point(5, row)] = Stone.WHITE
+    board[Point(1, 1)] = Stone.WHITE
+    return new_game(board)
+
+
+def test_game_score_empty_board():
+    assert new_game(Board(9)).score() == {Stone.BLACK: 0, Stone.WHITE: 7.5}
+
+
+def test_game_score_dead_stones():
+    game = walled_game()
+    # the A-B region touches the white stone on A1, so it is nobody's
+    assert game.score() == {Stone.BLACK: 7, Stone.WHITE: 8 + 14 + 7.5}
+    assert game.score([Point(1, 1)]) == {Stone.BLACK: 7 + 14, Stone.WHITE: 7 + 14 + 7.5}
+
+
+def test_game_score_shared_region_is_neutral():
+    board = Board(5)
+    board[Point(1, 1)] = Stone.BLACK
+    board[Point(5, 5)] = Stone.WHITE
+    assert new_game(board).score() == {Stone.BLACK: 1, Stone.WHITE: 1 + 7.5}
+
+
+def test_game_score_dead_stone_on_empty_point():
+    game = walled_game()
+    assert game.score([Point(1, 1), Point(2, 2)]) == game.score([Point(1, 1)])
@@ -0,0 +1,84 @@
+# Copyright (C) 2025  J. Alex Long <jalexlong@proton.me>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import multiprocessing
+import threading
+
+import pytest
+from libgoban import Stone, Point, Board, Game, Player
+
+np = pytest.importorskip("numpy")
+from libgoban.ownership import (OwnershipCancelledError, _dead_stones,
+                                estimate_ownership, estimate_ownership_batch)
+
+
+def walled_game():
+    # black walls off columns A-B, white walls off columns E-G and
+    # column D is left as dame. The white stone on A1 is dead.
+    board = Board(7)
+    for row in range(1, 8):
+        board[Point(3, row)] = Stone.BLACK
+        board[Point(5, row)] = Stone.WHITE
+    board[Point(1, 1)] = Stone.WHITE
+    return Game(Player("black", Stone.BLACK), Player("white", Stone.WHITE),
+                board, history=[])
+
+
+def test_ownership_dead_stones():
+    game = walled_game()
+    estimate = estimate_ownership(game, playouts=32, seed=1)
+    assert estimate.ownership.shape == (7, 7)
+    assert (estimate.ownership[:, :3] > 0.5).all()
+    assert (estimate.ownership[:, 4:] < -0.5).all()
+    assert estimate.dead_stones == {Point(1, 1)}
+
+
+def test_ownership_dead_stones_whole_groups():
+    board = Board(5)
+    board[Point(1, 1)] = Stone.WHITE
+    board[Point(2, 1)] = Stone.WHITE
+    board[Point(5, 5)] = Stone.BLACK
+    ownership = np.zeros((5, 5))
+    ownership[0, 0] = 0.9
+    ownership[0, 1] = 0.2
+    ownership[4, 4] = -0.4
+    # the white pair averages 0.55 and dies together, the black stone lives
+    assert _dead_stones(board.state, ownership, 0.5) == {Point(1, 1), Point(2, 1)}
+    assert _dead_stones(board.state, ownership, 0.6) == set()
+
+
+def test_ownership_workers_are_deterministic():
+    games = [walled_game(), walled_game()]
+    inline = estimate_ownership_batch(games, playouts=8, chunk_size=4, seed=7)
+    pooled = estimate_ownership_batch(games, playouts=8, chunk_size=4, seed=7, workers=2)
+    for a, b in zip(inline, pooled):
+        np.testing.assert_array_equal(a.ownership, b.ownership)
+
+
+def test_ownership_cancel():
+    cancel = threading.Event()
+    cancel.set()
+    with pytest.raises(OwnershipCancelledError):
+        estimate_ownership(walled_game(), cancel=cancel)
+
+
+def test_ownership_cancel_stops_workers():
+    game = Game(Player("black", Stone.BLACK), Player("white", Stone.WHITE),
+                Board(19), history=[])
+    cancel = threading.Event()
+    cancel.set()
+    with pytest.raises(OwnershipCancelledError):
+        estimate_ownership(game, playouts=1000, workers=2, chunk_size=1, cancel=cancel)
+    assert multiprocessing.active_children() == []